@@ -1,26 +1,46 @@
 import click
-import yaml
 import subprocess
 import os
+import copy
+import functools
+import importlib
+import hashlib
+import pickle
+import shlex
+import shutil
+import select
 from typing import Dict, List
 import sys
-import signal
 import time
-import questionary
-import pyfiglet
-import psutil
+import signal
+import threading
 from rich.console import Console
-from rich.table import Table
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.live import Live
-from rich.layout import Layout
 from rich.style import Style
 from rich import box
-from rich.text import Text
-from rich.prompt import Confirm
 
-console = Console()
+# pyfiglet, questionary, PyYAML and the rest of rich are imported where they are used
+# so that non-interactive commands don't pay for them at startup
+
+class LazyModule:
+    """Stand-in for a module global that imports the module on first attribute access
+
+    Unlike importlib.util.LazyLoader this is safe when several threads touch the module
+    first at the same time: import_module serialises the import itself.
+    """
+    def __init__(self, name: str):
+        self._name = name
+
+    def __getattr__(self, attr):
+        module = importlib.import_module(self._name)
+        globals()[self._name] = module
+        return getattr(module, attr)
+
+# Commands that never look at processes (add, clear-cache, --help) skip loading psutil
+psutil = LazyModule('psutil')
+
+# Messages are styled explicitly, so skip rich's per-print regex highlighter
+console = Console(highlight=False)
 
 # Custom styles
 HEADER_STYLE = Style(color="cyan", bold=True)
@@ -29,9 +49,46 @@ ERROR_STYLE = Style(color="red", bold=True)
 INFO_STYLE = Style(color="blue")
 WARNING_STYLE = Style(color="yellow")
 
+# Services table layout: (header, style, justify) per column
+SERVICE_TABLE_COLUMNS = (
+    ("Service", "cyan", "left"),
+    ("Status", "green", "center"),
+    ("Command", "yellow", "left"),
+    ("Directory", "blue", "left"),
+    ("VEnv", "magenta", "left"),
+    ("Delay", "magenta", "right"),
+)
+
+# How each service status is shown in the table: (label, style)
+STATUS_DISPLAY = {
+    "running": ("🟢 running", "green"),
+    "stopped": ("🔴 stopped", "red"),
+    "unknown": ("⚪ unknown", "yellow"),
+}
+
+# Characters that only mean something to /bin/sh: pipes, lists, redirection, expansion, globs
+SHELL_METACHARS = frozenset('|&;<>()$`*?[]{}~#\n')
+# Builtins that have no executable of their own to run directly
+SHELL_BUILTINS = frozenset(('cd', 'export', 'source', '.', 'exec', 'set', 'unset', 'ulimit', 'umask', 'eval'))
+
+# POSIX: services have no console of their own, so their output is appended to <name>.log here
+SERVICE_LOG_DIR = os.path.join(os.environ.get('XDG_STATE_HOME') or os.path.expanduser('~/.local/state'), 'srv')
+
+# Windows: cmd.exe operators and builtins, which CreateProcess can't run by itself
+CMD_METACHARS = frozenset('&|<>^%')
+CMD_BUILTINS = frozenset(('assoc', 'call', 'cd', 'chdir', 'cls', 'copy', 'del', 'dir', 'echo', 'erase',
+                          'for', 'ftype', 'if', 'md', 'mkdir', 'mklink', 'move', 'path', 'popd', 'pushd',
+                          'rd', 'ren', 'rename', 'rmdir', 'set', 'setlocal', 'start', 'title', 'type', 'ver'))
+
+# Parsed config files are pickled here so later runs can skip YAML parsing
+CONFIG_CACHE_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'srv')
+
 class AsciiArt:
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def get_banner():
+        import pyfiglet
+
         try:
             text_art = pyfiglet.figlet_format("SRV.GLXY", font="cosmic")
             width = max(len(line) for line in text_art.split('\n'))
@@ -47,7 +104,106 @@ class AsciiArt:
             # Fallback if cosmic font is not available
             return pyfiglet.figlet_format("SRV.GLXY")
 
+def exe_process_names(base_name: str) -> frozenset:
+    """Lowercased process names an executable service may show up under"""
+    base_name = base_name.lower()
+    return frozenset({base_name, base_name.removesuffix('.exe')})
+
+def make_name_matcher(base_name: str):
+    """Build the cheap process-name check for a service command"""
+    if base_name.endswith('.py'):
+        # For Python scripts the interpreter runs them, so any python process is a candidate
+        return lambda name: bool(name) and 'python' in name.lower()
+    names = exe_process_names(base_name)
+    return lambda name: bool(name) and name.lower() in names
+
+def make_cmdline_matcher(base_name: str):
+    """Build the cmdline check for a service command"""
+    if not base_name.endswith('.py'):
+        return bool
+
+    def match(cmdline):
+        # One substring search over the joined cmdline rejects most interpreters
+        # before the exact per-argument basename comparison
+        return (bool(cmdline) and base_name in ' '.join(cmdline) and
+                any(base_name == os.path.basename(arg) for arg in cmdline))
+    return match
+
+def make_cwd_matcher(directory: str):
+    """Build a check of /proc/<pid>/cwd against directory, compared as bytes (Linux only)
+
+    The kernel resolves the link to a canonical absolute path, so no decoding or
+    normpath is needed before the compare.
+    """
+    directory_b = os.fsencode(directory)
+
+    def match(pid):
+        try:
+            cwd = os.readlink(b'/proc/%d/cwd' % pid)
+        except OSError:
+            return False
+        return cwd == directory_b
+    return match
+
+def iter_proc_pids():
+    """Yield the pid of every process listed in /proc (Linux only)"""
+    for entry in os.scandir('/proc'):
+        if entry.name.isdigit():
+            yield int(entry.name)
+
+def read_proc_stat(pid: int):
+    """Return (name, is_zombie) from /proc/<pid>/stat, or None if the process is gone"""
+    try:
+        with open(f'/proc/{pid}/stat', 'rb') as f:
+            stat = f.read()
+    except OSError:
+        return None
+    # The name sits in parentheses and may itself contain ') '
+    end = stat.rfind(b')')
+    return os.fsdecode(stat[stat.find(b'(') + 1:end]), stat[end + 2:end + 3] == b'Z'
+
+def read_proc_cmdline(pid: int):
+    """Return the argument list from /proc/<pid>/cmdline, or None if the process is gone"""
+    try:
+        with open(f'/proc/{pid}/cmdline', 'rb') as f:
+            return [os.fsdecode(arg) for arg in f.read().split(b'\0')[:-1]]
+    except OSError:
+        return None
+
+def full_proc_name(name: str, cmdline: List[str]) -> str:
+    """Undo the kernel's 15 character truncation of name using cmdline, as psutil does"""
+    if len(name) >= 15 and cmdline:
+        exe_name = os.path.basename(cmdline[0])
+        if exe_name.startswith(name):
+            return exe_name
+    return name
+
+def linux_proc_snapshot() -> List[dict]:
+    """Process info dicts (pid, name, status, cmdline, cwd) read straight from /proc
+
+    Zombies and processes without a cmdline (kernel threads) can never match a service,
+    so they are dropped before their cwd link is read.
+    """
+    snapshot = []
+    for pid in iter_proc_pids():
+        stat = read_proc_stat(pid)
+        if stat is None or stat[1]:
+            continue
+        cmdline = read_proc_cmdline(pid)
+        if not cmdline:
+            continue
+        try:
+            cwd = os.readlink(f'/proc/{pid}/cwd')
+        except OSError:
+            cwd = None
+        snapshot.append({'pid': pid, 'name': full_proc_name(stat[0], cmdline),
+                         'status': None, 'cmdline': cmdline, 'cwd': cwd})
+    return snapshot
+
 class Service:
+    # How long (seconds) a checked status is reused by get_status()
+    STATUS_TTL = 0.5
+
     def __init__(self, name: str, command: str, directory: str = None, delay: int = 0, venv: str = None):
         self.name = name
         self.command = command
@@ -57,106 +213,181 @@ class Service:
         self.process = None
         self.pid = None
         self.status = "stopped"
-        self._find_running_process()
+        # Handle of the last process matched for this service, validated by create time
+        self._proc = None
+        self._create_time = None
+        self._status_checked_at = 0.0
+        # The process table is only searched once something asks for the status
+        self._status_checked = False
+        # Set by stop_service to abort a start that is still waiting out its delay
+        self._cancel = threading.Event()
 
-    def _find_running_process(self):
-        """Find if this service is already running by checking process names and working directory"""
-        try:
-            base_command = self.command.split()[0]
-            base_name = os.path.basename(base_command)
-            expected_dir = os.path.normpath(os.path.expanduser(self.directory)) if self.directory else None
+        # Process matchers, specialised once per service instead of re-deriving the
+        # criteria from attributes for every process
+        self._base_name = os.path.basename(self.command.split()[0])
+        self._is_python = self._base_name.endswith('.py')
+        self._match_name = make_name_matcher(self._base_name)
+        self._match_cmdline = make_cmdline_matcher(self._base_name)
+        self._expected_dir = os.path.normpath(os.path.expanduser(self.directory)) if self.directory else None
+        self._match_cwd_raw = make_cwd_matcher(self._expected_dir) if self._expected_dir else None
 
-            for proc in psutil.process_iter(['name', 'pid', 'cmdline', 'status', 'cwd']):
-                try:
-                    # Skip invalid processes
-                    if (proc.status() == psutil.STATUS_ZOMBIE or 
-                        not proc.is_running()):
-                        continue
-
-                    cmdline = proc.cmdline()
-                    if not cmdline:
-                        continue
-
-                    # Check working directory if specified
-                    if expected_dir:
-                        try:
-                            proc_cwd = os.path.normpath(proc.cwd())
-                            if proc_cwd != expected_dir:
-                                continue
-                        except (psutil.NoSuchProcess, psutil.AccessDenied):
-                            continue
-
-                    # For Python scripts
-                    if base_name.endswith('.py'):
-                        if ('python' in proc.name().lower() and 
-                            any(base_name == os.path.basename(cmd) for cmd in cmdline)):
-                            self.pid = proc.pid
-                            self.status = "running"
-                            return
-                    # For executables
-                    elif base_name.lower() == proc.name().lower():
-                        self.pid = proc.pid
-                        self.status = "running"
-                        return
-
-                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+        # Launch details derived from the command never change for a service
+        self._is_exe = self.command.endswith('.exe') or '/' in self.command or '\\' in self.command
+        if self._expected_dir:
+            self._exe_path = os.path.normpath(os.path.abspath(os.path.join(self._expected_dir, self.command)))
+        else:
+            self._exe_path = os.path.normpath(os.path.abspath(self.command))
+        self._activate_script = None
+        if self.venv:
+            venv_path = os.path.join(os.path.normpath(os.path.expanduser(self.venv)), 'venv')
+            if sys.platform == 'win32':
+                self._activate_script = os.path.join(venv_path, 'Scripts', 'activate.ps1')
+            else:
+                self._activate_script = os.path.join(venv_path, 'bin', 'activate')
+
+    def _match_process(self, info, check_cwd=True):
+        """Check a process info dict (name, cmdline, cwd, status) against this service"""
+        # Cheapest fields first so most processes are rejected before cmdline/cwd are looked at
+        if not self._match_name(info['name']) or info['status'] == psutil.STATUS_ZOMBIE:
+            return False
+
+        if not self._match_cmdline(info['cmdline']):
+            return False
+
+        # Check working directory if specified
+        if self._expected_dir and check_cwd and info['cwd'] != self._expected_dir:
+            return False
+
+        return True
+
+    def _walk_matching(self):
+        """Yield processes from the process table that match this service"""
+        if sys.platform.startswith('linux'):
+            yield from self._walk_proc()
+            return
+
+        # Only name and status are read for every process; cmdline and cwd are
+        # fetched just for the few whose name already matches
+        for proc in psutil.process_iter(['name', 'status']):
+            info = proc.info
+            if not self._match_name(info['name']):
+                continue
+            try:
+                info.update(proc.as_dict(['cmdline', 'cwd']))
+            except psutil.NoSuchProcess:
+                continue
+            if self._match_process(info):
+                yield proc
+
+    def _walk_proc(self):
+        """Linux version of _walk_matching that reads /proc directly
+
+        Each pid costs one read of /proc/<pid>/stat (name and state); the cwd link and
+        cmdline are only read for the pids that get past the cheaper checks before them.
+        """
+        for pid in iter_proc_pids():
+            stat = read_proc_stat(pid)
+            if stat is None or stat[1]:
+                continue
+            name = stat[0]
+            # Truncated names are settled from cmdline below
+            truncated = len(name) >= 15
+            if not truncated and not self._match_name(name):
+                continue
+
+            if self._match_cwd_raw and not self._match_cwd_raw(pid):
+                continue
+
+            cmdline = read_proc_cmdline(pid)
+            if cmdline is None:
+                continue
+            if truncated:
+                name = full_proc_name(name, cmdline)
+                if not self._match_name(name):
                     continue
-            
-            self.pid = None
-            self.status = "stopped"
 
+            info = {'name': name, 'status': None, 'cmdline': cmdline}
+            if not self._match_process(info, check_cwd=False):
+                continue
+            try:
+                yield psutil.Process(pid)
+            except psutil.NoSuchProcess:
+                continue
+
+    def _find_running_process(self):
+        """Find if this service is already running by checking process names and working directory"""
+        try:
+            proc = next(self._walk_matching(), None)
         except Exception as e:
             console.print(f"Error checking process status for {self.name}: {str(e)}", style=ERROR_STYLE)
-            self.pid = None
-            self.status = "stopped"
+            proc = None
+        self._record_lookup(proc)
+
+    def _record_lookup(self, proc):
+        """Store the outcome of a process table search (the matching Process, or None)"""
+        self._status_checked = True
+        self._status_checked_at = time.monotonic()
+        if proc is not None:
+            try:
+                self._remember_process(proc)
+                return
+            except psutil.NoSuchProcess:
+                pass
+        self.pid = None
+        self.status = "stopped"
+
+    def _remember_process(self, proc):
+        """Cache a matched process so later checks can skip the full verification"""
+        self._proc = proc
+        self._create_time = proc.create_time()
+        self.pid = proc.pid
+        self.status = "running"
+
+    def _ensure_status(self):
+        """Search the process table for this service the first time its status is needed"""
+        if not self._status_checked:
+            self._find_running_process()
 
     def is_running(self):
         """Check if the service is currently running"""
+        self._ensure_status()
         if self.pid is None:
             return False
-            
-        try:
-            process = psutil.Process(self.pid)
-            
-            if not process.is_running() or process.status() == psutil.STATUS_ZOMBIE:
-                self.pid = None
-                return False
 
+        # Fast path: the cached handle still refers to the same process (pid + create time)
+        if self._proc is not None:
             try:
-                cmdline = process.cmdline()
-                if not cmdline:
-                    self.pid = None
-                    return False
-
-                # Verify working directory if specified
-                if self.directory:
-                    expected_dir = os.path.normpath(os.path.expanduser(self.directory))
-                    proc_cwd = os.path.normpath(process.cwd())
-                    if proc_cwd != expected_dir:
-                        self.pid = None
-                        return False
-
-                # Get base command name
-                base_command = self.command.split()[0]
-                base_name = os.path.basename(base_command)
-
-                # Verify it's the correct process
-                if base_name.endswith('.py'):
-                    is_correct_process = ('python' in process.name().lower() and 
-                                        any(base_name == os.path.basename(cmd) for cmd in cmdline))
-                else:
-                    is_correct_process = base_name.lower() == process.name().lower()
+                with self._proc.oneshot():
+                    if (self._proc.pid == self.pid and
+                        self._proc.is_running() and
+                        self._proc.create_time() == self._create_time and
+                        self._proc.status() != psutil.STATUS_ZOMBIE):
+                        return True
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+            self._proc = None
+            self._create_time = None
 
-                if not is_correct_process:
-                    self.pid = None
-                    return False
+        try:
+            process = psutil.Process(self.pid)
 
-                return True
+            # oneshot() caches the stat/status reads behind name and status; cmdline and cwd
+            # are separate /proc reads it doesn't cover, so they are only fetched once the
+            # cheap fields have matched
+            with process.oneshot():
+                info = process.as_dict(['name', 'status'])
+            if not self._match_name(info['name']) or info['status'] == psutil.STATUS_ZOMBIE:
+                self.pid = None
+                return False
+            info.update(process.as_dict(['cmdline', 'cwd']))
 
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
+            if not self._match_process(info):
                 self.pid = None
                 return False
 
+            self._remember_process(process)
+            return True
+
         except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
             self.pid = None
             return False
@@ -165,51 +396,313 @@ class Service:
             self.pid = None
             return False
 
-    def get_status(self):
+    def get_status(self, live: bool = True):
+        # With live=False only what is already known is reported, without touching the process table
+        if not live:
+            return self.status if self._status_checked else "unknown"
+
+        # Back-to-back listings (e.g. in interactive mode) reuse a status checked moments ago;
+        # start_service/stop_service update self.status themselves
+        now = time.monotonic()
+        if now - self._status_checked_at < self.STATUS_TTL:
+            return self.status
+
+        # A Popen we spawned ourselves answers directly from the OS without a process table scan
+        if self.process is not None:
+            if self.process.poll() is None:
+                self.status = "running"
+            else:
+                self.status = "stopped"
+                self.process = None
+                self.pid = None
+                self._proc = None
+            self._status_checked = True
+            self._status_checked_at = now
+            return self.status
+
         if self.is_running():
             self.status = "running"
         else:
             self.status = "stopped"
             self.pid = None
+        self._status_checked_at = now
         return self.status
 
-    def get_activation_command(self):
-        if not self.venv:
-            return None
-            
-        venv_path = os.path.join(os.path.normpath(os.path.expanduser(self.venv)), 'venv')
-        
-        if sys.platform == 'win32':
-            activate_script = os.path.join(venv_path, 'Scripts', 'activate.ps1')
-            return f'& "{activate_script}"'
-        else:
-            activate_script = os.path.join(venv_path, 'bin', 'activate')
-            return f'source "{activate_script}"'
+    def get_activate_script(self):
+        return self._activate_script
 
     def is_exe(self):
-        return self.command.endswith('.exe') or '/' in self.command or '\\' in self.command
+        return self._is_exe
 
     def get_exe_path(self):
-        if self.directory:
-            return os.path.normpath(os.path.abspath(os.path.join(os.path.expanduser(self.directory), self.command)))
-        return os.path.normpath(os.path.abspath(self.command))
+        return self._exe_path
+
+def snapshot_ppid_map():
+    """Map each parent pid to its child pids from a single pass over the process table"""
+    ppid_map = {}
+    for proc in psutil.process_iter(['ppid']):
+        ppid = proc.info['ppid']
+        if ppid is not None and ppid != proc.pid:
+            ppid_map.setdefault(ppid, []).append(proc.pid)
+    return ppid_map
+
+def get_descendants(pid: int, ppid_map: Dict[int, List[int]]) -> List[int]:
+    """Walk ppid_map to collect every pid below pid"""
+    descendants = []
+    pending = [pid]
+    while pending:
+        children = ppid_map.get(pending.pop(), ())
+        descendants.extend(children)
+        pending.extend(children)
+    return descendants
+
+def wait_for_exit(pids: List[int], timeout: float):
+    """Wait for processes to exit, returning (gone, alive) lists of pids
+
+    On Linux each pid gets a pidfd and the whole set is waited on with a single poll(),
+    so exits are seen as they happen rather than by psutil's sleep-and-recheck loop.
+    """
+    def wait_with_psutil(pids):
+        gone = []
+        procs = []
+        for pid in pids:
+            try:
+                procs.append(psutil.Process(pid))
+            except psutil.NoSuchProcess:
+                gone.append(pid)
+        exited, alive = psutil.wait_procs(procs, timeout=timeout)
+        return gone + [p.pid for p in exited], [p.pid for p in alive]
+
+    if not hasattr(os, 'pidfd_open'):
+        return wait_with_psutil(pids)
+
+    gone = []
+    fds = {}
+    try:
+        for pid in pids:
+            try:
+                fds[os.pidfd_open(pid)] = pid
+            except ProcessLookupError:
+                gone.append(pid)
+    except OSError:
+        # Kernel without pidfd support
+        for fd in fds:
+            os.close(fd)
+        return wait_with_psutil(pids)
+
+    poller = select.poll()
+    for fd in fds:
+        poller.register(fd, select.POLLIN)
+
+    deadline = time.monotonic() + timeout
+    try:
+        while fds:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            for fd, _ in poller.poll(remaining * 1000):
+                poller.unregister(fd)
+                os.close(fd)
+                gone.append(fds.pop(fd))
+    finally:
+        for fd in fds:
+            os.close(fd)
+
+    # Reap the ones that are our own children so they don't linger as zombies
+    for pid in gone:
+        try:
+            os.waitpid(pid, os.WNOHANG)
+        except ChildProcessError:
+            pass
+
+    return gone, [*fds.values()]
+
+def get_own_process_group(pid: int):
+    """Return pid if it leads its own POSIX session and process group, else None
+
+    That is what start_new_session=True gives services started by srv. Any shell job
+    leader also heads a group, one that may hold processes outside the service's tree,
+    so those fall back to per-pid signals.
+    """
+    if sys.platform == 'win32':
+        return None
+    try:
+        pgid = os.getpgid(pid)
+        sid = os.getsid(pid)
+    except ProcessLookupError:
+        return None
+    # Never signal the group srv itself is running in
+    if pgid != pid or sid != pid or pgid == os.getpgrp():
+        return None
+    return pgid
+
+def signal_procs(pids: List[int], pgid: int = None, kill: bool = False):
+    """Terminate (or kill) pids, with a single killpg() for those in process group pgid"""
+    if pgid is not None:
+        try:
+            os.killpg(pgid, signal.SIGKILL if kill else signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+        # Children that moved to a group of their own (setsid/setpgid) are missed by killpg
+        outside = []
+        for pid in pids:
+            try:
+                if os.getpgid(pid) != pgid:
+                    outside.append(pid)
+            except ProcessLookupError:
+                pass
+        pids = outside
+
+    if sys.platform == 'win32':
+        for pid in pids:
+            try:
+                p = psutil.Process(pid)
+                if kill:
+                    p.kill()
+                else:
+                    p.terminate()
+            except psutil.NoSuchProcess:
+                pass
+        return
+
+    # A plain kill() per pid; psutil would first re-read /proc to confirm each one still exists
+    sig = signal.SIGKILL if kill else signal.SIGTERM
+    for pid in pids:
+        try:
+            os.kill(pid, sig)
+        except ProcessLookupError:
+            pass
+
+@functools.cache
+def _yaml():
+    """Import PyYAML on first use; runs served from the config cache never need it"""
+    import yaml
+    # Prefer the libyaml-backed loader/dumper when PyYAML was built with it
+    try:
+        from yaml import CSafeLoader as Loader, CSafeDumper as Dumper
+    except ImportError:
+        from yaml import SafeLoader as Loader, SafeDumper as Dumper
+    return yaml, Loader, Dumper
+
+def yaml_load(stream):
+    yaml, Loader, _ = _yaml()
+    return yaml.load(stream, Loader=Loader)
+
+def yaml_dump(data, stream=None, **kwargs):
+    """Dump data to stream, or return it as a string when no stream is given"""
+    yaml, _, Dumper = _yaml()
+    return yaml.dump(data, stream, Dumper=Dumper, **kwargs)
+
+def _config_cache_path(config_path: str) -> str:
+    """Cache file holding the pickled parse of config_path, keyed by its absolute path"""
+    digest = hashlib.sha1(os.path.abspath(config_path).encode('utf-8')).hexdigest()
+    return os.path.join(CONFIG_CACHE_DIR, f"{digest}.pickle")
+
+def load_config_file(config_path: str, stamp):
+    """Parse a config file, reusing the pickled result from an earlier run if stamp still matches"""
+    cache_file = _config_cache_path(config_path)
+
+    try:
+        with open(cache_file, 'rb') as f:
+            cached_stamp, config = pickle.load(f)
+        if cached_stamp == stamp:
+            return config
+    except Exception:
+        # Missing, stale-format or unreadable cache: fall back to parsing
+        pass
+
+    with open(config_path, 'r', encoding='utf-8') as f:
+        config = yaml_load(f)
+
+    save_config_cache(config_path, stamp, config)
+    return config
+
+def save_config_cache(config_path: str, stamp, config):
+    """Pickle the parsed form of a config file for later runs; failures are ignored"""
+    cache_file = _config_cache_path(config_path)
+    try:
+        os.makedirs(CONFIG_CACHE_DIR, exist_ok=True)
+        tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+        with open(tmp_file, 'wb') as f:
+            pickle.dump((stamp, config), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass
+
+def clear_config_cache():
+    """Remove all pickled config caches; they are rebuilt on the next load"""
+    shutil.rmtree(CONFIG_CACHE_DIR, ignore_errors=True)
+
+def shell_argv(command: str):
+    """POSIX: split a command into argv for a direct exec, or None if it needs /bin/sh"""
+    if any(c in SHELL_METACHARS for c in command):
+        return None
+    try:
+        argv = shlex.split(command)
+    except ValueError:
+        # Unbalanced quotes: leave the error to the shell
+        return None
+    # Leading VAR=value assignments and builtins are shell syntax too
+    if not argv or '=' in argv[0] or argv[0] in SHELL_BUILTINS:
+        return None
+    return argv
+
+def service_log_path(service_name: str) -> str:
+    """POSIX: file a service's stdout and stderr are appended to"""
+    return os.path.join(SERVICE_LOG_DIR, f"{service_name.replace(os.sep, '_')}.log")
+
+def resolve_command_line(command: str, env: Dict[str, str] = None):
+    """Windows: rewrite a command line so its program is an absolute path, or None if it needs cmd
+
+    CreateProcess only searches the parent's PATH and only for .exe files, so the program
+    is looked up here against the service's own PATH and PATHEXT (.cmd, .bat, ...).
+    Operators, builtins, batch files and programs that can't be found are left to cmd /c.
+    """
+    command = command.strip()
+    if any(c in CMD_METACHARS for c in command):
+        return None
+    program = shlex.split(command, posix=False)[0]
+    if program.strip('"').lower() in CMD_BUILTINS:
+        return None
+    path = shutil.which(program.strip('"'), path=(env or os.environ).get('PATH'))
+    if path is None or path.lower().endswith(('.bat', '.cmd')):
+        return None
+    return subprocess.list2cmdline([path]) + command[len(program):]
+
+# Parsed config per absolute path, as (stamp, config), shared by every DevEnvironment in the
+# process and re-read only when the file's (mtime, size) stamp changes. Only the parsed file
+# is shared: each CLI invocation still builds its own DevEnvironment and Services, since
+# those hold process state that goes stale between invocations
+_parsed_configs = {}
+
+def make_progress():
+    """Spinner-style progress display used while starting services"""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+    )
 
 class DevEnvironment:
-    def __init__(self):
+    def __init__(self, config_path: str = None):
+        self.config_path = config_path or self.find_config_path()
+        self.services = {}
+        self.load_config()
+
+    @staticmethod
+    def find_config_path():
         # Look for config file in current directory first, then fallback to home directory
         local_config = 'devenv_config.yaml'
         home_config = os.path.expanduser('~/.srv_glxy.yml')
         
         if os.path.exists(local_config):
-            self.config_path = local_config
-        else:
-            self.config_path = home_config
-            
-        self.services = {}
-        self.load_config()
+            return local_config
+        return home_config
 
     def show_welcome_screen(self):
-        console.print(AsciiArt.get_banner(), style="cyan bold")
+        console.print(AsciiArt.get_banner(), style=HEADER_STYLE)
 
     def create_default_config(self):
         default_config = {
@@ -230,8 +723,7 @@ class DevEnvironment:
         }
         
         try:
-            with open(self.config_path, 'w') as f:
-                yaml.dump(default_config, f, default_flow_style=False)
+            self.write_config(default_config)
             
             console.print(Panel("✨ Created default configuration file", 
                               style="green",
@@ -239,6 +731,120 @@ class DevEnvironment:
         except Exception as e:
             console.print(f"❌ Error creating default configuration: {str(e)}", style=ERROR_STYLE)
 
+    def read_config(self):
+        """Return a copy of the parsed config file, re-parsing only when it has changed on disk"""
+        key = os.path.abspath(self.config_path)
+        st = os.stat(self.config_path)
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = _parsed_configs.get(key)
+        if cached is None or cached[0] != stamp:
+            cached = _parsed_configs[key] = (stamp, load_config_file(self.config_path, stamp))
+        return copy.deepcopy(cached[1])
+
+    def write_config(self, config):
+        """Write config back to the config file, skipping the write if nothing changed
+
+        Keys keep their insertion order, so services that weren't touched serialize
+        exactly as before.
+        """
+        key = os.path.abspath(self.config_path)
+        cached = _parsed_configs.get(key)
+        if cached is not None and config == cached[1]:
+            st = os.stat(self.config_path)
+            if (st.st_mtime_ns, st.st_size) == cached[0]:
+                return False
+
+        data = yaml_dump(config, default_flow_style=False, allow_unicode=True, sort_keys=False)
+
+        # Write a temp file beside the config and swap it in, so an interrupted write never
+        # leaves a truncated config behind. fsync is opt-in (SRV_FSYNC=1): it is most of the
+        # cost of the write and only matters if the machine loses power
+        target = os.path.realpath(self.config_path)
+        tmp_path = f"{target}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(data.encode('utf-8'))
+                if os.environ.get('SRV_FSYNC') == '1':
+                    f.flush()
+                    os.fsync(f.fileno())
+            if os.path.exists(target):
+                shutil.copymode(target, tmp_path)
+            os.replace(tmp_path, target)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+        # What was just written is the parsed form of the file, so neither the next read
+        # nor the next run needs to parse it
+        st = os.stat(self.config_path)
+        stamp = (st.st_mtime_ns, st.st_size)
+        _parsed_configs[key] = (stamp, copy.deepcopy(config))
+        save_config_cache(self.config_path, stamp, config)
+        return True
+
+    @staticmethod
+    def _snapshot_processes():
+        """Read name, status, cmdline and cwd of every process once, as a list of info dicts"""
+        if sys.platform.startswith('linux'):
+            return linux_proc_snapshot()
+        return [proc.info for proc in psutil.process_iter(['pid', 'name', 'status', 'cmdline', 'cwd'])]
+
+    def _refresh_all_statuses(self, service_names: List[str] = None):
+        """Look up every service not yet checked from one shared pass over the process table"""
+        services = self.services.values() if service_names is None else \
+            [self.services[name] for name in service_names if name in self.services]
+        pending = [service for service in services if not service._status_checked]
+        if not pending:
+            return
+        # Index the services by what a process must carry to be a candidate for them: the
+        # script basename in its cmdline for Python services, its name for executables.
+        # Each process is then looked up once instead of being tested against every service
+        by_script = {}
+        by_name = {}
+        for service in pending:
+            if service._is_python:
+                by_script.setdefault(service._base_name, []).append(service)
+            else:
+                for name in exe_process_names(service._base_name):
+                    by_name.setdefault(name, []).append(service)
+
+        found = {}
+        for info in self._snapshot_processes():
+            name, cmdline = info['name'], info['cmdline']
+            if not name or not cmdline:
+                continue
+            name = name.lower()
+            candidates = by_name.get(name, [])
+            if by_script and 'python' in name:
+                for script in by_script.keys() & {os.path.basename(arg) for arg in cmdline}:
+                    candidates = candidates + by_script[script]
+            for service in candidates:
+                if service not in found and service._match_process(info):
+                    found[service] = info['pid']
+
+        for service in pending:
+            proc = None
+            if service in found:
+                try:
+                    proc = psutil.Process(found[service])
+                except psutil.NoSuchProcess:
+                    pass
+            service._record_lookup(proc)
+
+    @staticmethod
+    def _build_service(name: str, service_config: dict) -> Service:
+        """Create a Service from its entry in the config file"""
+        service_config = dict(service_config, name=name)
+        # Convert paths back to Windows format if needed
+        if sys.platform == 'win32':
+            for key in ('directory', 'venv', 'command'):
+                if service_config.get(key):
+                    service_config[key] = service_config[key].replace('/', '\\')
+        return Service(**service_config)
+
     def load_config(self):
         try:
             if not os.path.exists(self.config_path):
@@ -249,8 +855,7 @@ class DevEnvironment:
             console.print(f"Loading config from: {self.config_path}", style=INFO_STYLE)
             
             # Load and parse YAML
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
+            config = self.read_config()
             
             if not config:
                 console.print("❌ Empty configuration file", style=ERROR_STYLE)
@@ -265,16 +870,7 @@ class DevEnvironment:
             self.services = {}
             for name, service_config in config['services'].items():
                 try:
-                    # Convert paths back to Windows format if needed
-                    if service_config.get('directory'):
-                        service_config['directory'] = service_config['directory'].replace('/', '\\')
-                    if service_config.get('venv'):
-                        service_config['venv'] = service_config['venv'].replace('/', '\\')
-                    if service_config.get('command'):
-                        service_config['command'] = service_config['command'].replace('/', '\\')
-                    
-                    service_config['name'] = name
-                    self.services[name] = Service(**service_config)
+                    self.services[name] = self._build_service(name, service_config)
                     console.print(f"✓ Loaded service: {name}", style=SUCCESS_STYLE)
                 except Exception as e:
                     console.print(f"❌ Error loading service {name}: {str(e)}", style=ERROR_STYLE)
@@ -287,120 +883,151 @@ class DevEnvironment:
             import traceback
             console.print(traceback.format_exc(), style=ERROR_STYLE)
 
-    def start_service(self, service_name: str):
+    def start_service(self, service_name: str, progress=None):
+        """Start a service, reporting on progress (a shared rich Progress) if given"""
         if service_name not in self.services:
             console.print(f"❌ Service {service_name} not found", style=ERROR_STYLE)
             return False
 
+        if progress is None:
+            with make_progress() as progress:
+                return self.start_service(service_name, progress)
+
         service = self.services[service_name]
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            try:
-                task = progress.add_task(f"Starting {service_name}...", total=None)
-                
-                if service.delay > 0:
-                    progress.update(task, description=f"Waiting {service.delay}s before starting {service_name}...")
-                    time.sleep(service.delay)
-
-                working_dir = None
-                if service.directory:
-                    working_dir = os.path.normpath(os.path.expanduser(service.directory))
-                    if not os.path.exists(working_dir):
-                        raise FileNotFoundError(f"Directory not found: {working_dir}")
-                    console.print(f"Working directory: {working_dir}", style="blue")
-                
-                if sys.platform == 'win32':
-                    if service.venv:
-                        venv_path = os.path.join(os.path.normpath(os.path.expanduser(service.venv)), 'venv')
-                        activate_script = os.path.join(venv_path, 'Scripts', 'activate.ps1')
-                        
-                        if not os.path.exists(activate_script):
-                            raise FileNotFoundError(f"Virtual environment activation script not found: {activate_script}")
-                        
-                        # Create PowerShell script with error handling
-                        ps_content = f"""
-$ErrorActionPreference = 'Stop'
-try {{
-    Set-Location "{working_dir}"
-    & "{activate_script}"
-    {service.command}
-}} catch {{
-    Write-Host "Error: $_"
-    pause
-}}
-                        """.strip()
-                        
-                        ps_path = os.path.join(os.getcwd(), f"{service_name}_launcher.ps1")
-                        with open(ps_path, 'w') as f:
-                            f.write(ps_content)
-                        
-                        # Start PowerShell with proper arguments
-                        process = subprocess.Popen(
-                            ["powershell", "-NoExit", "-ExecutionPolicy", "Bypass", "-File", ps_path],
-                            cwd=working_dir,
-                            creationflags=subprocess.CREATE_NEW_CONSOLE | subprocess.CREATE_NEW_PROCESS_GROUP
-                        )
-                        
-                    elif service.is_exe():
-                        exe_path = service.get_exe_path()
-                        if not os.path.exists(exe_path):
-                            raise FileNotFoundError(f"Executable not found: {exe_path}")
-                        
-                        process = subprocess.Popen(
-                            exe_path,
-                            cwd=working_dir or os.path.dirname(exe_path),
-                            creationflags=subprocess.CREATE_NEW_CONSOLE | subprocess.CREATE_NEW_PROCESS_GROUP
-                        )
-                        
-                    else:
-                        # For non-venv, non-exe commands
-                        batch_content = f"""
-@echo off
-cd /d "{working_dir}"
-{service.command}
-if errorlevel 1 pause
-                        """.strip()
-                        
-                        batch_path = os.path.join(os.getcwd(), f"{service_name}_launcher.bat")
-                        with open(batch_path, 'w') as f:
-                            f.write(batch_content)
-                        
-                        process = subprocess.Popen(
-                            batch_path,
-                            cwd=working_dir,
-                            shell=True,
-                            creationflags=subprocess.CREATE_NEW_CONSOLE | subprocess.CREATE_NEW_PROCESS_GROUP
-                        )
+        try:
+            task = progress.add_task(f"Starting {service_name}...", total=None)
+            service._cancel.clear()
+            
+            if service.delay > 0:
+                progress.update(task, description=f"Waiting {service.delay}s before starting {service_name}...")
+                if service._cancel.wait(service.delay):
+                    progress.update(task, description=f"❌ Start of {service_name} cancelled")
+                    return False
+
+            working_dir = service._expected_dir
+            if working_dir:
+                if not os.path.exists(working_dir):
+                    raise FileNotFoundError(f"Directory not found: {working_dir}")
+                console.print(f"Working directory: {working_dir}", style=INFO_STYLE)
+            
+            # Activating a venv amounts to putting its scripts directory first on PATH,
+            # so the service gets that environment directly instead of an activate script
+            env = None
+            if service.venv:
+                venv_bin = os.path.dirname(service.get_activate_script())
+                if not os.path.isdir(venv_bin):
+                    raise FileNotFoundError(f"Virtual environment not found: {os.path.dirname(venv_bin)}")
+                env = dict(os.environ,
+                           VIRTUAL_ENV=os.path.dirname(venv_bin),
+                           PATH=venv_bin + os.pathsep + os.environ.get('PATH', ''))
+
+            if sys.platform == 'win32':
+                if service.is_exe() and not service.venv:
+                    exe_path = service.get_exe_path()
+                    if not os.path.exists(exe_path):
+                        raise FileNotFoundError(f"Executable not found: {exe_path}")
                     
-                    # Store process info and wait to verify it started
-                    service.process = process
-                    service.pid = process.pid
-                    time.sleep(2)  # Wait longer to ensure process starts
-
-                    # Verify process is running
-                    if service.is_running():
-                        service.status = "running"
-                        progress.update(task, description=f"✅ Started {service_name}")
-                        return True
-                    else:
-                        service.status = "stopped"
-                        service.pid = None
-                        progress.update(task, description=f"❌ Failed to start {service_name}")
-                        return False
-
-            except Exception as e:
-                console.print(Panel(f"Error starting {service_name}: {str(e)}\nDirectory: {service.directory}\nCommand: {service.command}", 
-                                style="red",
-                                box=box.ROUNDED))
-                service.status = "stopped"
-                service.pid = None
+                    process = subprocess.Popen(
+                        exe_path,
+                        cwd=working_dir or os.path.dirname(exe_path),
+                        creationflags=subprocess.CREATE_NEW_CONSOLE | subprocess.CREATE_NEW_PROCESS_GROUP
+                    )
+                    
+                else:
+                    # A plain command line goes straight to CreateProcess, with no launcher file
+                    # or intermediate PowerShell/cmd process; anything else runs under cmd /c
+                    command_line = resolve_command_line(service.command, env)
+                    process = subprocess.Popen(
+                        command_line or service.command,
+                        shell=command_line is None,
+                        cwd=working_dir,
+                        env=env,
+                        creationflags=subprocess.CREATE_NEW_CONSOLE | subprocess.CREATE_NEW_PROCESS_GROUP
+                    )
+
+            else:
+                # A plain command is exec'd directly instead of through /bin/sh, so the pid we
+                # track is the service itself; one using shell syntax still gets a shell.
+                # A new session gives it its own process group either way.
+                # The service must not hold srv's terminal or pipes: stdin is /dev/null (so it
+                # can't take keystrokes meant for the prompts) and output goes to its log file
+                argv = shell_argv(service.command)
+                os.makedirs(SERVICE_LOG_DIR, exist_ok=True)
+                log_path = service_log_path(service_name)
+                with open(log_path, 'ab') as log:
+                    process = subprocess.Popen(
+                        argv or service.command,
+                        shell=argv is None,
+                        cwd=working_dir,
+                        env=env,
+                        stdin=subprocess.DEVNULL,
+                        stdout=log,
+                        stderr=subprocess.STDOUT,
+                        start_new_session=True
+                    )
+                console.print(f"Logging to: {log_path}", style=INFO_STYLE)
+
+            # Store process info and wait to verify it started
+            service.process = process
+            service.pid = process.pid
+            service._status_checked = True
+
+            # Poll with a growing interval rather than waiting a fixed 2s: a service that
+            # comes up is confirmed within ~50ms, one that exits is caught within ~1.5s
+            for delay in (0.05, 0.1, 0.2, 0.4, 0.8):
+                time.sleep(delay)
+                if process.poll() is not None or service.is_running():
+                    break
+
+            # The process we spawned is the service even when its name doesn't match the
+            # command (npm -> node, a shell wrapper), so it counts as started while it's alive
+            if process.poll() is None:
+                service._remember_process(psutil.Process(process.pid))
+                progress.update(task, description=f"✅ Started {service_name}")
+                return True
+            else:
+                self._discard_process(service)
+                progress.update(task, description=f"❌ Failed to start {service_name}")
                 return False
 
-    def list_services(self):
+        except Exception as e:
+            console.print(Panel(f"Error starting {service_name}: {str(e)}\nDirectory: {service.directory}\nCommand: {service.command}", 
+                            style="red",
+                            box=box.ROUNDED))
+            self._discard_process(service)
+            return False
+
+    @staticmethod
+    def _discard_process(service: Service):
+        """Forget a failed start, terminating the spawned process if it is still around"""
+        process = service.process
+        if process is not None and process.poll() is None:
+            process.kill()
+            process.wait()
+        service.process = None
+        service.pid = None
+        service._proc = None
+        service.status = "stopped"
+
+    def start_services(self, service_names: List[str]):
+        """Start several services concurrently under a single progress display"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        service_names = [*service_names]
+        if not service_names:
+            return []
+
+        # Spawning is I/O-bound (delays, Popen, startup checks), so each service gets a thread;
+        # rich allows one live display at a time, so they all report into the same Progress
+        with make_progress() as progress, \
+             ThreadPoolExecutor(max_workers=min(8, len(service_names))) as executor:
+            return [*executor.map(lambda name: self.start_service(name, progress), service_names)]
+
+    def list_services(self, live: bool = True):
+        from rich.table import Table
+        from rich.text import Text
+
         try:
             table = Table(
                 title="🔧 Development Services",
@@ -409,21 +1036,17 @@ if errorlevel 1 pause
                 border_style="bright_blue"
             )
             
-            table.add_column("Service", style="cyan", justify="left")
-            table.add_column("Status", style="green", justify="center")
-            table.add_column("Command", style="yellow")
-            table.add_column("Directory", style="blue")
-            table.add_column("VEnv", style="magenta")
-            table.add_column("Delay", justify="right", style="magenta")
+            for header, style, justify in SERVICE_TABLE_COLUMNS:
+                table.add_column(header, style=style, justify=justify)
             
+            if live:
+                self._refresh_all_statuses()
             for name, service in self.services.items():
-                status = service.get_status()
-                status_style = "green" if status == "running" else "red"
-                status_icon = "🟢" if status == "running" else "🔴"
+                status_label, status_style = STATUS_DISPLAY[service.get_status(live)]
                 
                 table.add_row(
                     name,
-                    Text(f"{status_icon} {status}", style=status_style),
+                    Text(status_label, style=status_style),
                     service.command,
                     service.directory or "Current Directory",
                     service.venv or "None",
@@ -434,83 +1057,111 @@ if errorlevel 1 pause
         except Exception as e:
             console.print(f"❌ Error listing services: {str(e)}", style=ERROR_STYLE)
 
-    def add_service_to_config(self, name: str, command: str, directory: str = None, venv: str = None, delay: int = 0):
-        """Helper method to safely add a service to the config file"""
+    def remove_services(self, service_names: List[str]):
+        """Remove services from the config file with a single read, write and reload"""
+        config = self.read_config()
+        removed = []
+        for service_name in service_names:
+            if service_name in config['services']:
+                del config['services'][service_name]
+                removed.append(service_name)
+                console.print(f"✨ Removed service: {service_name}", style=SUCCESS_STYLE)
+            else:
+                console.print(f"Service not found: {service_name}", style=WARNING_STYLE)
+
+        if removed:
+            self.write_config(config)
+            self.load_config()
+        return removed
+
+    def add_services_to_config(self, specs: List[dict]) -> List[Service]:
+        """Helper method to safely add services to the config file, all in one write
+
+        Each spec has a name and command, and optionally directory, venv and delay.
+        Returns the new Services, for the caller to register; empty if they couldn't be added.
+        """
         try:
             # Read existing config
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f) or {'services': {}}
+            config = self.read_config() or {'services': {}}
             
-            if 'services' not in config:
+            if not config.get('services'):
                 config['services'] = {}
-                
-            # Convert Windows paths to use forward slashes
-            if directory:
-                directory = directory.replace('\\', '/')
-            if venv:
-                venv = venv.replace('\\', '/')
-            if command:
-                command = command.replace('\\', '/')
-                
-            # Add new service
-            config['services'][name] = {
-                'command': str(command),  # Ensure string type
-                'directory': str(directory) if directory else None,
-                'venv': str(venv) if venv else None,
-                'delay': int(delay)
-            }
+
+            names = []
+            for spec in specs:
+                name = str(spec['name'])
+                command = spec['command']
+                directory = spec.get('directory')
+                venv = spec.get('venv')
+
+                # Convert Windows paths to use forward slashes
+                if directory:
+                    directory = directory.replace('\\', '/')
+                if venv:
+                    venv = venv.replace('\\', '/')
+                if command:
+                    command = command.replace('\\', '/')
+                    
+                # Add new service
+                config['services'][name] = {
+                    'command': str(command),  # Ensure string type
+                    'directory': str(directory) if directory else None,
+                    'venv': str(venv) if venv else None,
+                    'delay': int(spec.get('delay') or 0)
+                }
+                names.append(name)
             
             # Write updated config
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                yaml.dump(config, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+            self.write_config(config)
             
-            return True
+            return [self._build_service(name, config['services'][name]) for name in names]
         except Exception as e:
             console.print(f"❌ Error updating config file: {str(e)}", style=ERROR_STYLE)
-            return False
+            return []
 
-    def stop_service(self, service_name: str):
-        """Stop a running service"""
+    def stop_service(self, service_name: str, ppid_map: Dict[int, List[int]] = None):
+        """Stop a running service
+
+        When stopping several services, pass one snapshot_ppid_map() to all calls so the
+        process table is read once instead of once per children() lookup.
+        """
         if service_name not in self.services:
             console.print(f"❌ Service {service_name} not found", style=ERROR_STYLE)
             return False
 
         service = self.services[service_name]
+        service._cancel.set()
         
         try:
             if not service.is_running():
                 console.print(f"Service {service_name} is not running", style=WARNING_STYLE)
                 return True
 
-            if sys.platform == 'win32':
-                # Try to terminate the process and its children
-                parent = psutil.Process(service.pid)
-                children = parent.children(recursive=True)
-                
-                for child in children:
-                    try:
-                        child.terminate()
-                    except psutil.NoSuchProcess:
-                        pass
-                
-                try:
-                    parent.terminate()
-                except psutil.NoSuchProcess:
-                    pass
-                
-                # Wait for processes to terminate
-                gone, alive = psutil.wait_procs([parent] + children, timeout=3)
-                
-                # Force kill if still alive
-                for p in alive:
-                    try:
-                        p.kill()
-                    except psutil.NoSuchProcess:
-                        pass
+            # Terminate the process and its children; is_running() just validated the cached handle
+            # The tree is handled as plain pids; psutil.Process objects are only built
+            # where a signal or wait has to go through psutil
+            parent = service._proc
+            if ppid_map is None:
+                child_pids = [child.pid for child in parent.children(recursive=True)]
             else:
-                # Unix-like systems
-                os.kill(service.pid, signal.SIGTERM)
-                
+                child_pids = get_descendants(parent.pid, ppid_map)
+            pids = child_pids + [parent.pid]
+
+            # A service srv started in its own session is signalled in one killpg(),
+            # which also reaches children spawned after the snapshot above
+            pgid = get_own_process_group(parent.pid)
+            signal_procs(pids, pgid)
+
+            # Wait for the whole tree at once, then force kill whatever is left
+            gone, alive = wait_for_exit(pids, timeout=3)
+            if alive:
+                signal_procs(alive, pgid, kill=True)
+                _, alive = wait_for_exit(alive, timeout=2)
+            if alive:
+                console.print(f"❌ Failed to stop {service_name}: pids {', '.join(map(str, alive))} still running",
+                              style=ERROR_STYLE)
+                return False
+
             service.pid = None
             service.process = None
             service.status = "stopped"
@@ -522,7 +1173,24 @@ if errorlevel 1 pause
             console.print(f"❌ Error stopping {service_name}: {str(e)}", style=ERROR_STYLE)
             return False
 
+    def stop_services(self, service_names: List[str]):
+        """Stop several services concurrently from one shared process table snapshot"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        service_names = [*service_names]
+        if not service_names:
+            return []
+
+        # Status and the ppid map are both read once up front, before any thread starts,
+        # so the workers only ever read shared state and need no locking
+        self._refresh_all_statuses(service_names)
+        ppid_map = snapshot_ppid_map()
+        with ThreadPoolExecutor(max_workers=min(8, len(service_names))) as executor:
+            return [*executor.map(lambda name: self.stop_service(name, ppid_map), service_names)]
+
 def get_service_selection(services: Dict[str, Service], message: str) -> List[str]:
+    import questionary
+
     try:
         choices = [questionary.Choice(name, checked=True) for name in services.keys()]
         return questionary.checkbox(
@@ -538,6 +1206,43 @@ def get_service_selection(services: Dict[str, Service], message: str) -> List[st
         console.print(f"❌ Error in service selection: {str(e)}", style=ERROR_STYLE)
         return []
 
+def prompt_new_service():
+    """Ask for a new service's settings in a single form
+
+    Returns a spec for DevEnvironment.add_services_to_config, or None if the form was
+    cancelled or the name or command left empty.
+    """
+    import questionary
+
+    answers = questionary.form(
+        name=questionary.text("Service name:"),
+        command=questionary.text("Command to run:"),
+        directory=questionary.text("Working directory (optional):"),
+        venv=questionary.text("Virtual environment path (optional):"),
+        delay=questionary.text("Start delay in seconds:", default="0",
+                               validate=lambda v: v.strip().isdecimal() or "Enter a non-negative integer"),
+    ).ask()
+    if not answers or not answers['name'] or not answers['command']:
+        return None
+    return {
+        'name': answers['name'],
+        'command': answers['command'],
+        'directory': answers['directory'] or None,
+        'venv': answers['venv'] or None,
+        'delay': int(answers['delay'])
+    }
+
+def _commit_services(dev_env, specs: List[dict]):
+    """Add services to the config in a single write and register them with dev_env"""
+    for service in dev_env.add_services_to_config(specs):
+        # Only these entries changed, so register them instead of reloading every service
+        dev_env.services[service.name] = service
+        console.print(f"✨ Added service: {service.name}", style=SUCCESS_STYLE)
+
+# Subcommands share one DevEnvironment through the click context instead of each
+# building (and loading the config for) their own
+pass_env = click.make_pass_decorator(DevEnvironment, ensure=True)
+
 @click.group()
 def cli():
     """🚀 Development Environment Management CLI"""
@@ -549,98 +1254,76 @@ def cli():
     except Exception as e:
         console.print(f"❌ Command error: {str(e)}", style=ERROR_STYLE)
 
+def _interactive_start(dev_env):
+    selected = get_service_selection(dev_env.services, "Select services to start:")
+    if selected:
+        dev_env.start_services(selected)
+
+def _interactive_stop(dev_env):
+    selected = get_service_selection(dev_env.services, "Select services to stop:")
+    if selected:
+        dev_env.stop_services(selected)
+
+def _interactive_list(dev_env):
+    dev_env.list_services()
+
+def _interactive_add(dev_env):
+    try:
+        spec = prompt_new_service()
+        if spec:
+            _commit_services(dev_env, [spec])
+        
+    except Exception as e:
+        console.print(f"❌ Error adding service: {str(e)}", style=ERROR_STYLE)
+
+def _interactive_remove(dev_env):
+    from rich.prompt import Confirm
+
+    try:
+        selected = get_service_selection(dev_env.services, "Select services to remove:")
+        if selected:
+            if Confirm.ask(f"Are you sure you want to remove the following services: {', '.join(selected)}?"):
+                dev_env.remove_services(selected)
+    except Exception as e:
+        console.print(f"❌ Error removing service: {str(e)}", style=ERROR_STYLE)
+
+def _interactive_exit(dev_env):
+    console.print(Panel("👋 Goodbye!", 
+                      style="bold blue",
+                      box=box.ROUNDED))
+    return False
+
+# Interactive menu entries, in display order; a handler returning False ends the session
+INTERACTIVE_ACTIONS = {
+    "Start Services": _interactive_start,
+    "Stop Services": _interactive_stop,
+    "List Services": _interactive_list,
+    "Add Service": _interactive_add,
+    "Remove Service": _interactive_remove,
+    "Exit": _interactive_exit,
+}
+
 @cli.command()
-def interactive():
+@pass_env
+def interactive(dev_env):
     """Launch interactive mode"""
+    import questionary
+
     try:
-        dev_env = DevEnvironment()
         dev_env.show_welcome_screen()
         
         while True:
             action = questionary.select(
                 "What would you like to do?",
-                choices=[
-                    "Start Services",
-                    "Stop Services",
-                    "List Services",
-                    "Add Service",
-                    "Remove Service",
-                    "Exit"
-                ],
+                choices=[*INTERACTIVE_ACTIONS],
                 style=questionary.Style([
                     ('selected', 'bg:blue fg:white'),
                     ('pointer', 'fg:blue bold'),
                 ])
             ).ask()
             
-            if action == "Start Services":
-                selected = get_service_selection(dev_env.services, "Select services to start:")
-                if selected:
-                    for service in selected:
-                        dev_env.start_service(service)
-            
-            elif action == "Stop Services":
-                selected = get_service_selection(dev_env.services, "Select services to stop:")
-                if selected:
-                    for service in selected:
-                        dev_env.stop_service(service)
-            
-            elif action == "List Services":
-                dev_env.list_services()
-            
-            elif action == "Add Service":
-                try:
-                    name = questionary.text("Service name:").ask()
-                    if not name:
-                        continue
-                        
-                    command = questionary.text("Command to run:").ask()
-                    if not command:
-                        continue
-                        
-                    directory = questionary.text("Working directory (optional):").ask()
-                    venv = questionary.text("Virtual environment path (optional):").ask()
-                    delay = questionary.text("Start delay in seconds:", default="0").ask()
-                    
-                    if dev_env.add_service_to_config(
-                        name=name,
-                        command=command,
-                        directory=directory if directory else None,
-                        venv=venv if venv else None,
-                        delay=int(delay)
-                    ):
-                        console.print(f"✨ Added service: {name}", style=SUCCESS_STYLE)
-                        dev_env.load_config()
-                    
-                except Exception as e:
-                    console.print(f"❌ Error adding service: {str(e)}", style=ERROR_STYLE)
-            
-            elif action == "Remove Service":
-                try:
-                    selected = get_service_selection(dev_env.services, "Select services to remove:")
-                    if selected:
-                        if Confirm.ask(f"Are you sure you want to remove the following services: {', '.join(selected)}?"):
-                            for service in selected:
-                                with open(dev_env.config_path, 'r') as f:
-                                    config = yaml.safe_load(f)
-                                
-                                if service in config['services']:
-                                    del config['services'][service]
-                                    
-                                    with open(dev_env.config_path, 'w') as f:
-                                        yaml.dump(config, f, default_flow_style=False)
-                                    
-                                    console.print(f"✨ Removed service: {service}", style=SUCCESS_STYLE)
-                                    dev_env.load_config()
-                                else:
-                                    console.print(f"Service not found: {service}", style=WARNING_STYLE)
-                except Exception as e:
-                    console.print(f"❌ Error removing service: {str(e)}", style=ERROR_STYLE)
-            
-            elif action == "Exit":
-                console.print(Panel("👋 Goodbye!", 
-                                  style="bold blue",
-                                  box=box.ROUNDED))
+            handler = INTERACTIVE_ACTIONS.get(action)
+            if handler is not None and handler(dev_env) is False:
                 break
 
     except KeyboardInterrupt:
@@ -651,73 +1334,129 @@ def interactive():
         console.print(f"❌ Error in interactive mode: {str(e)}", style=ERROR_STYLE)
 @cli.command()
 @click.argument('service_names', nargs=-1)
-def start(service_names):
+@pass_env
+def start(dev_env, service_names):
     """Start specified services or all if none specified"""
     try:
-        dev_env = DevEnvironment()
-        
         if not service_names:
             service_names = dev_env.services.keys()
         
-        for service in service_names:
-            dev_env.start_service(service)
+        dev_env.start_services(service_names)
     except Exception as e:
         console.print(f"❌ Error starting services: {str(e)}", style=ERROR_STYLE)
 
 @cli.command()
 @click.argument('service_names', nargs=-1)
-def stop(service_names):
+@pass_env
+def stop(dev_env, service_names):
     """Stop specified services or all if none specified"""
     try:
-        dev_env = DevEnvironment()
-        
         if not service_names:
             service_names = dev_env.services.keys()
         
-        for service in service_names:
-            dev_env.stop_service(service)
+        dev_env.stop_services(service_names)
     except Exception as e:
         console.print(f"❌ Error stopping services: {str(e)}", style=ERROR_STYLE)
 
 @cli.command()
-def list():
+@click.option('--quick', is_flag=True, help="Don't check the process table; show only already known statuses")
+@pass_env
+def list(dev_env, quick):
     """List all configured services"""
     try:
-        dev_env = DevEnvironment()
-        dev_env.list_services()
+        dev_env.list_services(live=not quick)
     except Exception as e:
         console.print(f"❌ Error listing services: {str(e)}", style=ERROR_STYLE)
 
 @cli.command()
 @click.argument('service_names', nargs=-1)
-def remove(service_names):
+@pass_env
+def remove(dev_env, service_names):
     """Remove specified services from the configuration"""
+    from rich.prompt import Confirm
+
     try:
-        dev_env = DevEnvironment()
-        
         if not service_names:
             console.print("No services specified to remove", style=WARNING_STYLE)
             return
         
-        for service_name in service_names:
-            if Confirm.ask(f"Are you sure you want to remove {service_name}?"):
-                with open(dev_env.config_path, 'r') as f:
-                    config = yaml.safe_load(f)
-                
-                if service_name in config['services']:
-                    del config['services'][service_name]
-                    
-                    with open(dev_env.config_path, 'w') as f:
-                        yaml.dump(config, f, default_flow_style=False)
-                    
-                    console.print(f"✨ Removed service: {service_name}", style=SUCCESS_STYLE)
-                    dev_env.load_config()
-                else:
-                    console.print(f"Service not found: {service_name}", style=WARNING_STYLE)
+        # Confirm each one first, then apply all removals in one config write
+        confirmed = [name for name in service_names
+                     if Confirm.ask(f"Are you sure you want to remove {name}?")]
+        if confirmed:
+            dev_env.remove_services(confirmed)
                     
     except Exception as e:
         console.print(f"❌ Error removing services: {str(e)}", style=ERROR_STYLE)
 
+@cli.command()
+@click.option('--name', help="Service name")
+@click.option('--command', help="Command to run")
+@click.option('--directory', help="Working directory")
+@click.option('--venv', help="Virtual environment path")
+@click.option('--delay', type=click.IntRange(min=0), help="Start delay in seconds")
+@pass_env
+def add(dev_env, name, command, directory, venv, delay):
+    """Add a new service (interactively unless --name and --command are given)"""
+    given = [value for value in (name, command, directory, venv, delay) if value is not None]
+    if given and not (name and command):
+        raise click.UsageError("--name and --command are both required to add a service without prompting")
+
+    try:
+        if given:
+            spec = {'name': name, 'command': command, 'directory': directory, 'venv': venv, 'delay': delay or 0}
+        else:
+            spec = prompt_new_service()
+        if spec:
+            _commit_services(dev_env, [spec])
+            
+    except Exception as e:
+        console.print(f"❌ Error in add command: {str(e)}", style=ERROR_STYLE)
+
+@cli.command(name='add-bulk')
+@click.argument('file', type=click.Path(exists=True, dir_okay=False))
+@pass_env
+def add_bulk(dev_env, file):
+    """Add every service listed in a YAML/JSON FILE with a single config write
+
+    FILE holds either a list of services (each with name, command and optionally
+    directory, venv, delay) or a mapping of name to settings, as in the config's
+    services section.
+    """
+    try:
+        with open(file, 'r', encoding='utf-8') as f:
+            data = yaml_load(f)
+
+        if isinstance(data, dict):
+            data = data.get('services', data)
+            specs = [dict(settings or {}, name=name) for name, settings in data.items()]
+        else:
+            specs = data or []
+
+        # Same rules as the add command's options, checked for every entry before anything is written
+        for index, spec in enumerate(specs, 1):
+            if not isinstance(spec, dict) or not spec.get('name') or not spec.get('command'):
+                console.print(f"❌ Entry {index}: every service needs a name and a command: {spec}", style=ERROR_STYLE)
+                return
+            delay = spec.get('delay')
+            if delay is not None and (isinstance(delay, bool) or not str(delay).strip().isdecimal()):
+                console.print(f"❌ Entry {index} ({spec['name']}): delay must be a non-negative integer, got {delay!r}",
+                              style=ERROR_STYLE)
+                return
+
+        _commit_services(dev_env, specs)
+    except Exception as e:
+        console.print(f"❌ Error in add-bulk command: {str(e)}", style=ERROR_STYLE)
+
+@cli.command(name='clear-cache')
+def clear_cache():
+    """Clear the cached copies of parsed config files"""
+    try:
+        clear_config_cache()
+        console.print("✨ Cleared config cache", style=SUCCESS_STYLE)
+    except Exception as e:
+        console.print(f"❌ Error clearing cache: {str(e)}", style=ERROR_STYLE)
+
 if __name__ == '__main__':
     try:
         cli()
@@ -726,35 +1465,4 @@ if __name__ == '__main__':
                           style="bold blue",
                           box=box.ROUNDED))
     except Exception as e:
-        console.print(f"❌ Fatal error: {str(e)}", style=ERROR_STYLE)
-
-@cli.command()
-def add():
-    """Add a new service interactively"""
-    try:
-        dev_env = DevEnvironment()
-        
-        name = questionary.text("Service name:").ask()
-        if not name:
-            return
-            
-        command = questionary.text("Command to run:").ask()
-        if not command:
-            return
-            
-        directory = questionary.text("Working directory (optional):").ask()
-        venv = questionary.text("Virtual environment path (optional):").ask()
-        delay = questionary.text("Start delay in seconds:", default="0").ask()
-        
-        if dev_env.add_service_to_config(
-            name=name,
-            command=command,
-            directory=directory if directory else None,
-            venv=venv if venv else None,
-            delay=int(delay)
-        ):
-            console.print(f"✨ Added service: {name}", style=SUCCESS_STYLE)
-            dev_env.load_config()
-            
-    except Exception as e:
-        console.print(f"❌ Error in add command: {str(e)}", style=ERROR_STYLE)
\ No newline at end of file
+        console.print(f"❌ Fatal error: {str(e)}", style=ERROR_STYLE)
\ No newline at end of file